@@ -4,12 +4,16 @@ logger = logging.getLogger(__name__)
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm.base import ONETOMANY, MANYTOONE, MANYTOMANY
 import sqlalchemy.types as t
+import sqlalchemy.orm as orm
 from sqlalchemy.orm.mapper import configure_mappers
+from sqlalchemy.orm.properties import ColumnProperty, RelationshipProperty
+from sqlalchemy.ext.associationproxy import AssociationProxy, _AssociationList, _AssociationSet, _AssociationDict
 from .langhelpers import model_of
 from collections import namedtuple
 from functools import partial
 
 p = Pair = namedtuple("Pair", "left, right")
+Computed = namedtuple("Computed", "key, descriptor, model")  # hybrid, association_proxy, python's property
 
 
 class S(object):
@@ -21,15 +25,70 @@ class S(object):
 class Control(object):
     def __init__(self):
         self.mappers = {}  # class -> mapper
+        self.computed = {}  # (class, name) -> Computed
+        self.computed_types = {}  # Computed -> column type
 
     def get_property_from_object(self, ob, k):
-        return self.get_mapper_from_object(ob)._props[k]
+        mapper = self.get_mapper_from_object(ob)
+        try:
+            return mapper._props[k]
+        except KeyError:
+            return self.get_computed_from_object(ob, k)
+
+    def get_computed_from_object(self, ob, k):
+        model = model_of(ob)
+        try:
+            return self.computed[(model, k)]
+        except KeyError:
+            v = self.computed[(model, k)] = self._lookup_computed(model, k)
+            return v
+
+    def _lookup_computed(self, model, k):
+        mapper = self.get_mapper_from_object(model)
+        descriptor = mapper.all_orm_descriptors.get(k)
+        if descriptor is not None:
+            return Computed(k, descriptor, model)
+        for cls in model.__mro__:
+            if isinstance(cls.__dict__.get(k), property):
+                return Computed(k, cls.__dict__[k], model)
+        raise KeyError("{}.{} is not found (neither mapped property, hybrid, association proxy nor property)".format(model.__name__, k))
+
+    def get_expression_from_computed(self, prop):
+        if isinstance(prop.descriptor, property):
+            return None
+        # class level access, hybrid's sql expression or association proxy
+        try:
+            return getattr(prop.model, prop.key)
+        except Exception:
+            # hybrid only for python (e.g. len(self.children))
+            logger.debug("sql expression is not found: %s.%s", prop.model.__name__, prop.key, exc_info=True)
+            return None
+
+    def get_remote_property_from_computed(self, prop):
+        # proxied attribute of association proxy. None if it is not mapped (e.g. hybrid, python's property)
+        return getattr(self.get_expression_from_computed(prop).remote_attr, "property", None)
+
+    def get_proxied_relationship_from_computed(self, prop):
+        remote_prop = None
+        if isinstance(prop.descriptor, AssociationProxy):
+            remote_prop = self.get_remote_property_from_computed(prop)
+        if not isinstance(remote_prop, RelationshipProperty) or remote_prop.uselist:
+            raise ValueError("{}.{} is not an association proxy to related object".format(prop.model.__name__, prop.key))
+        return remote_prop
 
     def get_relationship_from_object(self, ob, k):
         mapper = self.get_mapper_from_object(ob)
         if mapper.__class__._new_mappers:
             configure_mappers()
-        return mapper._props[k]
+        try:
+            return mapper._props[k]
+        except KeyError:
+            return self.get_computed_from_object(ob, k)
+
+    def get_related_class_from_property(self, prop):
+        if isinstance(prop, Computed):
+            return self.get_proxied_relationship_from_computed(prop).mapper.class_
+        return prop.mapper.class_
 
     def get_mapper_from_object(self, ob):
         model = model_of(ob)
@@ -40,9 +99,46 @@ class Control(object):
             return v
 
     def get_type_from_property(self, prop):
-        return prop.columns[0].type.__class__
+        columntype = self.get_column_type_from_property(prop)
+        return columntype and columntype.__class__
+
+    def get_column_type_from_property(self, prop):
+        if not isinstance(prop, Computed):
+            return prop.columns[0].type
+        try:
+            return self.computed_types[prop]
+        except KeyError:
+            v = self.computed_types[prop] = self._lookup_computed_type(prop)
+            return v
+
+    def _lookup_computed_type(self, prop):
+        expression = self.get_expression_from_computed(prop)
+        if isinstance(prop.descriptor, AssociationProxy):
+            remote_prop = self.get_remote_property_from_computed(prop)
+            if not isinstance(remote_prop, ColumnProperty) or not expression.scalar:
+                return None
+            return remote_prop.columns[0].type
+        columntype = getattr(expression, "type", None)
+        if isinstance(columntype, t.NullType):
+            return None
+        return columntype
+
+    def get_item_column_type_from_property(self, prop):
+        # element's type of proxied collection
+        if not isinstance(prop, Computed) or not isinstance(prop.descriptor, AssociationProxy):
+            return None
+        remote_prop = self.get_remote_property_from_computed(prop)
+        if not isinstance(remote_prop, ColumnProperty) or self.get_expression_from_computed(prop).scalar:
+            return None
+        return remote_prop.columns[0].type
+
+    def is_deferred_property(self, prop):
+        return getattr(prop, "deferred", False)
 
     def get_shape_from_property(self, prop):
+        if isinstance(prop, Computed):
+            self.get_proxied_relationship_from_computed(prop)
+            return S.object if self.get_expression_from_computed(prop).scalar else S.array
         direction = prop.direction
         if direction == ONETOMANY:
             return S.array
@@ -72,6 +168,18 @@ class Abbreviation(object):
 Empty = ()
 
 
+def plain_collection(v):
+    # proxied collection of association proxy -> builtin's collection
+    if isinstance(v, _AssociationList):
+        return list(v)
+    elif isinstance(v, _AssociationSet):
+        return set(v)
+    elif isinstance(v, _AssociationDict):
+        return dict(v)
+    else:
+        return v
+
+
 class Serializer(object):
     def __init__(self, convertions, control, factory, renaming_options, abbreviation):
         self.convertions = convertions
@@ -103,11 +211,46 @@ class Serializer(object):
             else:
                 raise NotImplemented(shape)
         else:
-            return (S.atom, q, self.control.get_property_from_object(ob, q), getattr(ob, q))
+            prop = self.control.get_property_from_object(ob, q)
+            val = getattr(ob, q)
+            if isinstance(prop, Computed) and isinstance(prop.descriptor, AssociationProxy):
+                val = plain_collection(val)
+            return (S.atom, q, prop, val)
 
     def add_result(self, r, k, v):
         r[self.renaming_options.get(k, k)] = v
 
+    def load_options(self, model, q_collection, loader=orm):
+        """query options for loading fields of q_collection in bulk, e.g. query.options(*options)
+
+        deferred column_property is treated as expensive field. so it is undeferred only if its name is included in q_collection,
+        explicitly (not by abbreviation, e.g. "*").
+        """
+        options = []
+        for name in q_collection:
+            for q in self.abbreviation(model, name):
+                if isinstance(q, Pair):
+                    relationship = self.control.get_relationship_from_object(model, q.left)
+                    if isinstance(relationship, Computed):
+                        remote_prop = self.control.get_proxied_relationship_from_computed(relationship)
+                        sub_loader = loader.subqueryload(relationship.descriptor.target_collection).subqueryload(remote_prop.key)
+                    else:
+                        sub_loader = loader.subqueryload(q.left)
+                    options.append(sub_loader)
+                    sub = self.control.get_related_class_from_property(relationship)
+                    options.extend(self.load_options(sub, q.right, loader=sub_loader))
+                else:
+                    prop = self.control.get_property_from_object(model, q)
+                    if self.control.is_deferred_property(prop) and q == name:
+                        options.append(loader.undefer(q))
+                    elif isinstance(prop, Computed) and isinstance(prop.descriptor, AssociationProxy):
+                        sub_loader = loader.subqueryload(prop.descriptor.target_collection)
+                        remote_prop = self.control.get_remote_property_from_computed(prop)
+                        if isinstance(remote_prop, RelationshipProperty):
+                            sub_loader = sub_loader.subqueryload(remote_prop.key)
+                        options.append(sub_loader)
+        return options
+
     def build(self, r, shape, q, prop, val):
         if shape == S.atom:
             type_ = self.control.get_type_from_property(prop)
@@ -176,34 +319,43 @@ class JSONSchemaSerializer(Serializer):
 
     def detect_required(self, prop):
         columns = getattr(prop, "columns", Empty)
-        return any(not c.nullable and c.default is None for c in columns)
+        return any(not getattr(c, "nullable", True) and c.default is None for c in columns)
 
     def add_result(self, r, k, prop, v):
         data = {}
-        if v is None:
-            column = prop.columns[0]
-            columntype = column.type
-            data["type"] = default_column_to_schema[columntype.__class__]
-            if hasattr(columntype, "length"):
-                data["maxLength"] = columntype.length
-            if hasattr(columntype, "enums"):
-                data["enum"] = list(columntype.enums)
-
-            if isinstance(columntype, t.DateTime):
-                data["format"] = "date-time"
-            elif isinstance(columntype, t.Date):
-                data["format"] = "date"
-            elif isinstance(columntype, t.Time):
-                data["format"] = "time"
+        columntype = self.control.get_column_type_from_property(prop)
+        if v is None and columntype is not None:
+            data.update(self.schema_from_column_type(columntype))
+            # constraints inferred from an expression are not column's constraints
+            if not isinstance(prop, Computed):
+                if hasattr(columntype, "length"):
+                    data["maxLength"] = columntype.length
+                if hasattr(columntype, "enums"):
+                    data["enum"] = list(columntype.enums)
             data["required"] = self.detect_required(prop)
+        elif v is None:
+            itemtype = self.control.get_item_column_type_from_property(prop)
+            if itemtype is not None:
+                data["type"] = "array"
+                data["items"] = self.schema_from_column_type(itemtype)
         r[self.renaming_options.get(k, k)] = data
 
+    def schema_from_column_type(self, columntype):
+        data = {"type": default_column_to_schema[columntype.__class__]}
+        if isinstance(columntype, t.DateTime):
+            data["format"] = "date-time"
+        elif isinstance(columntype, t.Date):
+            data["format"] = "date"
+        elif isinstance(columntype, t.Time):
+            data["format"] = "time"
+        return data
+
     def parse(self, ob, q):
         if isinstance(q, Pair):
             k = q.left
             relationship = self.control.get_relationship_from_object(ob, k)
             shape = self.control.get_shape_from_property(relationship)
-            sub = relationship.mapper.class_
+            sub = self.control.get_related_class_from_property(relationship)
             sub_r = self.serialize(sub, q.right)
             return (shape, k, relationship, sub_r)
         else:
@@ -2,6 +2,8 @@
 import sqlalchemy as sa
 import sqlalchemy.orm as orm
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.ext.associationproxy import association_proxy
 
 Base = declarative_base()
 
@@ -68,3 +70,62 @@ class A2(Base):
     created_at = sa.Column(sa.DateTime(), nullable=False)
     a1_id = sa.Column(sa.Integer, sa.ForeignKey("a1.id"))
     a1 = orm.relationship(A1, backref="children")
+
+
+# computed fields
+
+
+class Project(Base):
+    __tablename__ = "projects"
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String(255), nullable=False)
+    task_names = association_proxy("tasks", "name")
+    task_tags = association_proxy("tasks", "tag")
+    task_titles = association_proxy("tasks", "title")
+    task_labels = association_proxy("tasks", "label")
+
+    @hybrid_property
+    def title(self):
+        return "project: " + self.name
+
+    @hybrid_property
+    def num_loaded_tasks(self):
+        return len(self.tasks)
+
+    @hybrid_property
+    def shout(self):
+        return self.name.upper() if self.name else None
+
+    @property
+    def is_empty(self):
+        return not self.tasks
+
+
+class Task(Base):
+    __tablename__ = "tasks"
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String(255), nullable=False)
+    project_id = sa.Column(sa.Integer, sa.ForeignKey("projects.id"))
+    project = orm.relationship(Project, backref="tasks")
+    tag_id = sa.Column(sa.Integer, sa.ForeignKey("tags.id"))
+    tag = orm.relationship("Tag")
+
+    @hybrid_property
+    def title(self):
+        return "task: " + self.name
+
+    @property
+    def label(self):
+        return "<{}>".format(self.name)
+
+
+class Tag(Base):
+    __tablename__ = "tags"
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String(255), nullable=False)
+
+
+Project.num_tasks = orm.column_property(
+    sa.select([sa.func.count(Task.id)]).where(Task.project_id == Project.id).correlate_except(Task).as_scalar(),
+    deferred=True
+)
@@ -1,6 +1,6 @@
 # -*- coding:utf-8 -*-
 from sqlash.tests.models import (
-    Group, User, A0, A1, A2, Team, Member
+    Group, User, A0, A1, A2, Team, Member, Project, Task, Tag
 )
 
 
@@ -144,3 +144,123 @@ def test_many_to_many2():
     assert result == {'created_at': None, 'name': 'y',
                       'teams': [{'created_at': None, 'name': 'foo'},
                                 {'created_at': None, 'name': 'boo'}]}
+
+
+def test_computed():
+    target = _makeOne({})()
+    project = Project(name="foo", tasks=[Task(name="x"), Task(name="y")])
+    result = target.serialize(project, ["title", "task_names", "is_empty"])
+    assert result == {'title': 'project: foo', 'task_names': ['x', 'y'], 'is_empty': False}
+    assert type(result["task_names"]) is list
+
+
+def test_computed_convert():
+    from sqlalchemy import types as t
+
+    target = _makeOne({t.String: lambda v, r: v.upper()})()
+    project = Project(name="foo")
+    result = target.serialize(project, ["title", "is_empty"])
+    assert result == {'title': 'PROJECT: FOO', 'is_empty': True}
+
+
+def test_computed_python_only_hybrid():
+    target = _makeOne({})()
+    project = Project(name="foo", tasks=[Task(name="x"), Task(name="y")])
+    result = target.serialize(project, ["num_loaded_tasks", "shout"])
+    assert result == {'num_loaded_tasks': 2, 'shout': 'FOO'}
+
+
+def test_computed_association_proxy_to_computed():
+    target = _makeOne({})()
+    project = Project(name="foo", tasks=[Task(name="x"), Task(name="y")])
+    result = target.serialize(project, ["task_titles", "task_labels"])
+    assert result == {'task_titles': ['task: x', 'task: y'], 'task_labels': ['<x>', '<y>']}
+    options = target.load_options(Project, ["task_titles", "task_labels"])
+    assert len(options) == 2
+
+
+def test_abbreviation_with_deferred():
+    target = _makeOne({})()
+    project = Project(id=1, name="foo")
+    result = target.serialize(project, ["*"])
+    assert result == {'id': 1, 'name': 'foo', 'num_tasks': None}
+    assert target.load_options(Project, ["*"]) == []
+    assert len(target.load_options(Project, ["*", "num_tasks"])) == 1
+
+
+def test_unknown_attribute():
+    import pytest
+    from sqlash import Pair
+
+    target = _makeOne({})()
+    project = Project(name="foo")
+    with pytest.raises(KeyError) as e:
+        target.serialize(project, ["nme"])
+    assert "Project.nme" in str(e.value)
+    with pytest.raises(KeyError) as e:
+        target.serialize(project, [Pair("taks", ["name"])])
+    assert "Project.taks" in str(e.value)
+
+
+def test_load_options():
+    import sqlalchemy as sa
+    import sqlalchemy.orm as orm
+    from sqlash import Pair
+    from sqlash.tests.models import Base
+
+    engine = sa.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = orm.Session(bind=engine)
+    session.add(Project(name="foo", tasks=[Task(name="x"), Task(name="y")]))
+    session.add(Project(name="bar"))
+    session.commit()
+    session.expunge_all()
+
+    target = _makeOne({})()
+    query = ["name", "num_tasks", "task_names", Pair("tasks", ["name"])]
+    projects = session.query(Project).options(*target.load_options(Project, query)).order_by(Project.id).all()
+
+    statements = []
+    sa.event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args))
+    result = [target.serialize(project, query) for project in projects]
+    assert statements == []
+    assert result == [
+        {'name': 'foo', 'num_tasks': 2, 'task_names': ['x', 'y'], 'tasks': [{'name': 'x'}, {'name': 'y'}]},
+        {'name': 'bar', 'num_tasks': 0, 'task_names': [], 'tasks': []},
+    ]
+
+
+def test_load_options_association_proxy_to_relationship():
+    import json
+    import sqlalchemy as sa
+    from sqlash import Pair
+    import sqlalchemy.orm as orm
+    from sqlash.tests.models import Base
+
+    engine = sa.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = orm.Session(bind=engine)
+    session.add(Project(name="foo", tasks=[Task(name="x", tag=Tag(name="a")), Task(name="y", tag=Tag(name="b"))]))
+    session.commit()
+    session.expunge_all()
+
+    target = _makeOne({})()
+    query = ["name", Pair("task_tags", ["name"])]
+    projects = session.query(Project).options(*target.load_options(Project, query)).all()
+
+    statements = []
+    sa.event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args))
+    result = [target.serialize(project, query) for project in projects]
+    assert statements == []
+    assert result == [{'name': 'foo', 'task_tags': [{'name': 'a'}, {'name': 'b'}]}]
+    assert json.dumps(result)
+
+
+def test_association_proxy_not_to_relationship():
+    import pytest
+    from sqlash import Pair
+
+    target = _makeOne({})()
+    project = Project(name="foo", tasks=[Task(name="x")])
+    with pytest.raises(ValueError):
+        target.serialize(project, [Pair("task_names", ["name"])])
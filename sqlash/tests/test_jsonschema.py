@@ -1,7 +1,7 @@
 # -*- coding:utf-8 -*-
 from functools import partial
 from sqlash.tests.models import (
-    Group, User, A0, A1, A2, Team, Member
+    Group, User, A0, A1, A2, Team, Member, Project
 )
 
 
@@ -103,3 +103,41 @@ def test_deep_nested():
                                'created_at': {'format': 'date-time', 'type': 'string'},
                                'a1': {'$ref': '#/definitions/A1', 'type': 'object'}}}
     assert result == expected
+
+
+def test_computed():
+    target = _makeOne()()
+    result = target.serialize(Project, ["title", "num_tasks", "is_empty"])
+    assert result == {'title': 'Project', 'required': [],
+                      'properties': {'title': {'type': 'string'},
+                                     'num_tasks': {'type': 'integer'},
+                                     'is_empty': {}}}
+
+
+def test_computed_python_only_hybrid():
+    target = _makeOne()()
+    result = target.serialize(Project, ["num_loaded_tasks", "shout"])
+    assert result == {'title': 'Project', 'required': [],
+                      'properties': {'num_loaded_tasks': {}, 'shout': {}}}
+
+
+def test_computed_association_proxy_to_computed():
+    target = _makeOne()()
+    result = target.serialize(Project, ["task_titles", "task_labels"])
+    assert result == {'title': 'Project', 'required': [],
+                      'properties': {'task_titles': {}, 'task_labels': {}}}
+
+
+def test_association_proxy_to_relationship():
+    from sqlash import Pair
+
+    target = _makeOne()()
+    result = target.serialize(Project, [Pair("task_tags", ["name"])])
+    assert result == {'definitions': {'Tag': {'title': 'Tag', 'properties': {'name': {'type': 'string', 'maxLength': 255}}, 'required': ['name']}}, 'title': 'Project', 'properties': {'task_tags': {'type': 'array', 'items': {'$ref': '#/definitions/Tag'}}}, 'required': []}
+
+
+def test_association_proxy_collection_of_column():
+    target = _makeOne()()
+    result = target.serialize(Project, ["task_names"])
+    assert result == {'title': 'Project', 'required': [],
+                      'properties': {'task_names': {'type': 'array', 'items': {'type': 'string'}}}}